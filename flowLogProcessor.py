@@ -2,12 +2,79 @@ import os
 import csv
 import logging
 import argparse
-from collections import defaultdict
-from typing import Dict, Tuple, List, Optional
+import mmap
+import re
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from typing import Dict, List, Optional
+
+# Optional array support: numpy is imported on its own because the pandas
+# path needs it even when numba is absent (pandas guarantees numpy).
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional fast path: a Numba-compiled counting kernel over packed
+# (dstport << 8) | protocol-number integer keys. The pure-Python path
+# below is used when it is not installed.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional vectorized field extraction: pandas' C parser pulls just the
+# dstport/protocol columns out of the file ~10x faster than Python split loops.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Optional ahead-of-time compiled hot loop (see flow_log_kernel.pyx); built
+# with `python setup.py build_ext --inplace`. Unlike the Numba kernel this
+# handles the bytes/dict workload directly, so it covers the whole default
+# path rather than just the counting step.
+try:
+    from flow_log_kernel import count_lines as _count_lines_compiled
+except ImportError:
+    _count_lines_compiled = None
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Canonical spellings for the common protocol names: a dict hit returns the
+# interned lowercase string without the allocation str.lower() makes even on
+# already-lowercase input.
+_PROTO_CANON = {}
+for _name in ('tcp', 'udp', 'icmp', 'gre', 'esp', 'ah', 'sctp', 'ipv6-icmp'):
+    _PROTO_CANON[_name] = _name
+    _PROTO_CANON[_name.upper()] = _name
+    _PROTO_CANON[_name.capitalize()] = _name
+del _name
+
+if njit is not None:
+    @njit(cache=True)
+    def _count_packed_keys(keys, tag_table, tag_counts, pair_counts):
+        """Count one chunk of packed keys against the dense rule table.
+
+        keys        -- int64 array of (dstport << 8) | protocol_number
+        tag_table   -- int32 array of 2**24 entries mapping key -> tag id (-1 = no rule)
+        tag_counts  -- int64 array indexed by tag id, updated in place
+        pair_counts -- int64 array of 2**24 entries, updated in place
+
+        Returns the number of keys with no matching rule.
+        """
+        untagged = 0
+        for i in range(keys.shape[0]):
+            key = keys[i]
+            pair_counts[key] += 1
+            tag_id = tag_table[key]
+            if tag_id >= 0:
+                tag_counts[tag_id] += 1
+            else:
+                untagged += 1
+        return untagged
+
 class FlowLogProcessor:
     """
     Process the flow logs (AWS Flow Logs format) based on the mapping rules and write the specific metrics to an output file.
@@ -19,9 +86,9 @@ class FlowLogProcessor:
     delimiter (str): Delimiter for flow log file.
     log_field_names (List[str]): Field names for flow log file.
     protocol_mapping_file (str): Path to IANA protocol mapping CSV file.
-    mapping_rules (Dict[Tuple[str, str], str]): Mapping rules
+    mapping_rules (Dict[int, str]): Mapping rules keyed by (dstport << 8) | protocol_number
     tag_counts (Dict[str, int]): Tag counts
-    port_protocol_counts (Dict[Tuple[str, str], int]): Port/Protocol combination counts
+    port_protocol_counts (Dict[int, int]): Counts keyed by (dstport << 8) | protocol_number
     untagged_count (int): Untagged count
     processed_lines (int): Processed lines count
     skipped_lines (int): Skipped lines
@@ -47,18 +114,52 @@ class FlowLogProcessor:
     # Protocol number to name mapping will be loaded from CSV if available
     PROTOCOL_NUMBER_TO_NAME = {}
 
+    # Size of the read buffer used when scanning the flow log file
+    READ_CHUNK_SIZE = 4 * 1024 * 1024
+
     def __init__(self, flow_log_file: str, mapping_file: str, output_file: str,
                  delimiter: str = ' ', log_field_names: Optional[List[str]] = None,
-                 protocol_mapping_file: Optional[str] = None):
+                 protocol_mapping_file: Optional[str] = None, workers: int = 1,
+                 verbose: bool = False):
         self.flow_log_file = flow_log_file
         self.mapping_file = mapping_file
         self.output_file = output_file
         self.delimiter = delimiter
+        # Hot loop works on bytes; encode the delimiter once up front.
+        self.delimiter_bytes = delimiter.encode('ascii')
+        # Precompiled default-format extractor: skips fields 0-5 without
+        # splitting them, captures dstport and protocol, and requires at least
+        # one further field - the same nine-field minimum the split-based
+        # parser enforced. One C-level findall per chunk replaces a Python
+        # split call per line.
+        delim = re.escape(self.delimiter_bytes)
+        field = b'[^' + delim + b'\n]+'
+        self._default_line_re = re.compile(
+            rb'^(?:' + field + delim + rb'){6}(\d{1,5})' + delim
+            + rb'(\d{1,3})' + delim + field, re.M)
         self.log_field_names = log_field_names
+        # Partial evaluation of the custom layout: the field list never
+        # changes mid-file, so resolve the dstport/protocol column indices
+        # (last occurrence wins, matching the old dict build) and the number
+        # of unknown field names once here. The scan loop then indexes the
+        # split parts directly instead of assembling a per-line dict.
+        self._custom_dstport_index = -1
+        self._custom_protocol_index = -1
+        self._custom_unknown_fields = 0
+        if log_field_names:
+            for i, name in enumerate(log_field_names):
+                if name == 'dstport':
+                    self._custom_dstport_index = i
+                elif name == 'protocol':
+                    self._custom_protocol_index = i
+                if name not in self.FIELD_MAPPING:
+                    self._custom_unknown_fields += 1
         self.protocol_mapping_file = protocol_mapping_file
-        self.mapping_rules: Dict[Tuple[str, str], str] = {}
-        self.tag_counts: Dict[str, int] = defaultdict(int)
-        self.port_protocol_counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.workers = max(1, workers)
+        self.verbose = verbose
+        self.mapping_rules: Dict[int, str] = {}
+        self.tag_counts: Counter = Counter()
+        self.port_protocol_counts: Counter = Counter()
         self.untagged_count: int = 0
         self.processed_lines: int = 0
         self.skipped_lines: int = 0
@@ -66,19 +167,6 @@ class FlowLogProcessor:
         # Load protocol mappings
         self.load_protocol_mappings()
 
-    def _sanitize_value(self, value: str, data_type):
-        """
-        Convert the value to the specified data type.
-        If the value is "-", return None.
-        If the conversion fails, return None.
-        """
-        if value == "-":
-            return None
-        try:
-            return data_type(value)
-        except ValueError:
-            return None
-
     def load_protocol_mappings(self) -> None:
         """
         Load protocol mappings from CSV file if available.
@@ -86,8 +174,8 @@ class FlowLogProcessor:
         """
         # Start with common protocols as fallback
         common_protocols = {
-            "1": "icmp", "6": "tcp", "17": "udp", "47": "gre", "50": "esp", 
-            "51": "ah", "58": "ipv6-icmp", "132": "sctp"
+            b"1": b"icmp", b"6": b"tcp", b"17": b"udp", b"47": b"gre", b"50": b"esp",
+            b"51": b"ah", b"58": b"ipv6-icmp", b"132": b"sctp"
         }
         
         # First try to load from specified file
@@ -97,8 +185,9 @@ class FlowLogProcessor:
                     reader = csv.DictReader(csvfile)
                     for row in reader:
                         if 'Decimal' in row and 'Keyword' in row:
-                            number = row['Decimal'].strip()
-                            name = row['Keyword'].strip().lower()
+                            number = row['Decimal'].strip().encode('ascii')
+                            raw_name = row['Keyword'].strip()
+                            name = (_PROTO_CANON.get(raw_name) or raw_name.lower()).encode('ascii')
                             if number and name:
                                 self.PROTOCOL_NUMBER_TO_NAME[number] = name
                                 
@@ -111,9 +200,23 @@ class FlowLogProcessor:
         self.PROTOCOL_NUMBER_TO_NAME = common_protocols
         logging.info("Using built-in protocol mappings")
         
-    def _protocol_number_to_name(self, protocol_number: str) -> str:
-        """Convert a protocol number to its name using IANA registry mapping."""
-        return self.PROTOCOL_NUMBER_TO_NAME.get(protocol_number, protocol_number)
+    def _read_mapping_rows(self):
+        """Yield valid (dstport, protocol, tag) rows from the mapping file."""
+        with open(self.mapping_file, 'r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.DictReader(csvfile)
+            for row in reader:
+                try:
+                    dstport = int(row.get('dstport', ''))
+                except ValueError:
+                    dstport = None
+                raw_protocol = row.get('protocol', '').strip()
+                protocol = _PROTO_CANON.get(raw_protocol) or raw_protocol.lower()
+                tag = row.get('tag', '').strip()
+
+                if dstport is not None and 0 <= dstport <= 65535 and protocol and tag:
+                    yield dstport, protocol, tag
+                else:
+                    logging.warning(f"Invalid mapping rule: {row}")
 
     def load_mapping_rules(self) -> None:
         """Load mapping rules from the mapping file."""
@@ -121,17 +224,21 @@ class FlowLogProcessor:
             if not os.path.isfile(self.mapping_file):
                 raise FileNotFoundError(f"Mapping file '{self.mapping_file}' not found.")
 
-            with open(self.mapping_file, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    dstport = self._sanitize_value(row.get('dstport', ''), int)
-                    protocol = row.get('protocol', '').lower().strip()
-                    tag = row.get('tag', '').strip()
-
-                    if dstport is not None and protocol and tag:
-                        self.mapping_rules[(str(dstport), protocol)] = tag
-                    else:
-                        logging.warning(f"Invalid mapping rule: {row}")
+            # Ports fit in 16 bits and protocol numbers in 8, so a rule key is
+            # a single packed int. A rule's protocol column names every number
+            # the parser would report under that name, so expand it over the
+            # effective name table; the hot loop then hashes one small int per
+            # line instead of a (str, str) tuple.
+            numbers_by_name: Dict[bytes, List[int]] = {}
+            for number, name in enumerate(self._effective_protocol_names()):
+                numbers_by_name.setdefault(name, []).append(number)
+            for dstport, protocol, tag in self._read_mapping_rows():
+                numbers = numbers_by_name.get(protocol.encode('ascii'))
+                if numbers:
+                    for number in numbers:
+                        self.mapping_rules[(dstport << 8) | number] = tag
+                else:
+                    logging.warning(f"Mapping rule for unknown protocol '{protocol}' ignored.")
 
         except FileNotFoundError as e:
             logging.error(f"Mapping rules error: {e}")
@@ -143,63 +250,446 @@ class FlowLogProcessor:
             logging.error(f"Unexpected error loading mapping rules: {e}")
             raise
 
-    def process_flow_logs(self) -> None:
-        """Process the flow logs and update the tag counts and port/protocol combination counts."""
+    def _effective_protocol_names(self) -> List[bytes]:
+        """Protocol name the parser would report for each number 0-255."""
+        names = []
+        for number in range(256):
+            number_bytes = str(number).encode('ascii')
+            names.append(self.PROTOCOL_NUMBER_TO_NAME.get(number_bytes, number_bytes))
+        return names
+
+    def _build_packed_tables(self):
+        """Build the dense rule table used by the Numba counting kernel.
+
+        Returns (tag_table, tag_names) where tag_table maps a
+        packed (dstport << 8) | protocol_number key to an index into tag_names,
+        with -1 meaning no rule. The table mirrors the dict lookup exactly: a
+        rule matches every protocol number whose reported name equals the
+        rule's protocol column (mapping_rules is already expanded that way).
+        """
+        tag_table = np.full(1 << 24, -1, dtype=np.int32)
+        tag_names: List[str] = []
+        tag_ids: Dict[str, int] = {}
+        for key, tag in self.mapping_rules.items():
+            tag_id = tag_ids.get(tag)
+            if tag_id is None:
+                tag_id = tag_ids[tag] = len(tag_names)
+                tag_names.append(tag)
+            tag_table[key] = tag_id
+        return tag_table, tag_names
+
+    def _fold_dense_counts(self, tag_count_array, tag_names, pair_counts) -> None:
+        """Fold dense per-tag and per-pair count arrays into the report dicts."""
+        for tag_id, tag in enumerate(tag_names):
+            if tag_count_array[tag_id]:
+                self.tag_counts[tag] += int(tag_count_array[tag_id])
+        for key in np.nonzero(pair_counts)[0]:
+            self.port_protocol_counts[int(key)] += int(pair_counts[key])
+
+    def _process_flow_logs_pandas(self) -> bool:
+        """Vectorized default-format scan using the pandas C parser.
+
+        Reads columns 6 (dstport), 7 (protocol) and 8 (the ninth field,
+        present iff the line has the full default width), masks out rows
+        with missing or out-of-range values, packs the rest into integer
+        keys and counts them via one np.unique pass, so Python-level work
+        is proportional to the number of distinct pairs rather than lines.
+
+        Returns False when the file cannot be parsed this way (e.g. ragged
+        rows in a mixed-version log); the caller falls back to the streaming
+        parser in that case.
+        """
         try:
-            if not os.path.isfile(self.flow_log_file):
-                raise FileNotFoundError(f"Flow log file '{self.flow_log_file}' not found.")
+            frame = pd.read_csv(
+                self.flow_log_file, sep=self.delimiter, header=None,
+                usecols=[6, 7, 8], dtype=str, engine='c',
+                skip_blank_lines=False)
+        except Exception as e:
+            logging.info(f"pandas fast path unavailable ({e}); using streaming parser.")
+            return False
 
-            with open(self.flow_log_file, 'r', encoding='utf-8') as logfile:
-                for line_number, line in enumerate(logfile, 1):
-                    self.processed_lines += 1
-                    parts = [part.strip() for part in line.strip().split(self.delimiter)]
+        processed = len(frame)
+        ports = pd.to_numeric(frame[6], errors='coerce').to_numpy()
+        protocols = pd.to_numeric(frame[7], errors='coerce').to_numpy()
+        # The streaming parsers require nine fields per line; a null ninth
+        # column means the row was short, so skip it like they do.
+        # Digit-only tokens, matching the int() semantics of the other
+        # parsers: to_numeric alone would also admit float and scientific
+        # forms ('80.5', '1e2') that every other path skips.
+        digit_tokens = (frame[6].str.fullmatch(r'\d+', na=False).to_numpy()
+                        & frame[7].str.fullmatch(r'\d+', na=False).to_numpy())
+        valid = (digit_tokens & frame[8].notna().to_numpy()
+                 & (ports >= 0) & (ports <= 65535)
+                 & (protocols >= 0) & (protocols <= 255))
+        skipped = processed - int(valid.sum())
+        keys = ((ports[valid].astype(np.int64) << 8)
+                | protocols[valid].astype(np.int64))
 
-                    if self.log_field_names:
-                        if len(parts) != len(self.log_field_names):
-                            logging.warning(f"Line {line_number}: Field count mismatch. Skipped.")
-                            self.skipped_lines += 1
-                            continue
-                        log_entry = {}
-                        for i, field_name in enumerate(self.log_field_names):
-                            if field_name in self.FIELD_MAPPING:
-                                data_type = self.FIELD_MAPPING[field_name][1]
-                                log_entry[field_name] = self._sanitize_value(parts[i], data_type)
-                            else:
-                                logging.warning(f"Line {line_number}: Unknown field name: {field_name}. Skipped.")
-                                self.skipped_lines += 1
-                                continue
-                        dstport = str(log_entry.get('dstport'))
-                        
-                        # Get protocol number and convert to protocol name
-                        protocol_number = str(log_entry.get('protocol'))
-                        protocol_name = self._protocol_number_to_name(protocol_number)
+        # Count against the dense rule table: a straight array index per key,
+        # no hashing or equality checks, and bincount aggregates the pairs in
+        # one C pass.
+        tag_table, tag_names = self._build_packed_tables()
+        pair_counts = np.bincount(keys, minlength=1 << 24)
+        tag_ids = tag_table[keys]
+        tag_count_array = np.bincount(tag_ids[tag_ids >= 0],
+                                      minlength=max(len(tag_names), 1))
+        self.untagged_count += int((tag_ids < 0).sum())
+        self._fold_dense_counts(tag_count_array, tag_names, pair_counts)
+
+        if skipped:
+            logging.warning(f"Skipped {skipped} lines with missing or malformed dstport/protocol.")
+        self.processed_lines += processed
+        self.skipped_lines += skipped
+        return True
+
+    def _process_flow_logs_packed(self) -> None:
+        """Default-format counting through the Numba kernel.
+
+        Lines are still split in Python, but dstport/protocol are packed into
+        one integer key per line and counted in a compiled loop against dense
+        arrays instead of per-line dict operations.
+        """
+        tag_table, tag_names = self._build_packed_tables()
+        tag_count_array = np.zeros(max(len(tag_names), 1), dtype=np.int64)
+        pair_counts = np.zeros(1 << 24, dtype=np.int64)
+
+        delimiter_bytes = self.delimiter_bytes
+        verbose = self.verbose
+        warn = logging.warning
+        processed = 0
+        skipped_malformed = 0
+        skipped_non_numeric = 0
+        skipped_out_of_range = 0
+        untagged = 0
+        line_number = 0
+
+        with open(self.flow_log_file, 'rb') as logfile:
+            tail = b''
+            while True:
+                chunk = logfile.read(self.READ_CHUNK_SIZE)
+                if not chunk:
+                    lines = tail.splitlines()
+                    tail = b''
+                else:
+                    if tail:
+                        chunk = tail + chunk
+                    newline_pos = chunk.rfind(b'\n')
+                    if newline_pos == -1:
+                        tail = chunk
+                        continue
+                    tail = chunk[newline_pos + 1:]
+                    # Keep the final terminator in the slice: without it
+                    # splitlines() drops a blank line sitting just before
+                    # it, under-counting against the other parsers.
+                    lines = chunk[:newline_pos + 1].splitlines()
+
+                keys = []
+                append_key = keys.append
+                for line in lines:
+                    line_number += 1
+                    processed += 1
+                    parts = line.split(delimiter_bytes, 8)
+                    if len(parts) != 9:
+                        if verbose:
+                            warn(f"Line {line_number}: Malformed default v2 line. Skipped.")
+                        skipped_malformed += 1
+                        continue
+                    try:
+                        port = int(parts[6])
+                        protocol_number = int(parts[7])
+                    except ValueError:
+                        if verbose:
+                            warn(f"Line {line_number}: Non-numeric dstport or protocol. Skipped.")
+                        skipped_non_numeric += 1
+                        continue
+                    if 0 <= port <= 65535 and 0 <= protocol_number <= 255:
+                        append_key((port << 8) | protocol_number)
                     else:
-                        # Default V2 flow log format
-                        if len(parts) >= 14:
-                            dstport = parts[6]
-                            # Get protocol number and convert to protocol name
-                            protocol_number = parts[7]
-                            protocol_name = self._protocol_number_to_name(protocol_number)
+                        if verbose:
+                            warn(f"Line {line_number}: dstport or protocol out of range. Skipped.")
+                        skipped_out_of_range += 1
+
+                if keys:
+                    untagged += int(_count_packed_keys(
+                        np.asarray(keys, dtype=np.int64), tag_table,
+                        tag_count_array, pair_counts))
+
+                if not chunk:
+                    break
+
+        self._fold_dense_counts(tag_count_array, tag_names, pair_counts)
+
+        # One summary warning per category instead of a logging call per bad
+        # line, which can dominate runtime on a corrupt file.
+        if skipped_malformed:
+            warn("Skipped %d malformed default v2 lines.", skipped_malformed)
+        if skipped_non_numeric:
+            warn("Skipped %d lines with non-numeric dstport or protocol.",
+                 skipped_non_numeric)
+        if skipped_out_of_range:
+            warn("Skipped %d lines with dstport or protocol out of range.",
+                 skipped_out_of_range)
+
+        self.processed_lines += processed
+        self.skipped_lines += (skipped_malformed + skipped_non_numeric
+                               + skipped_out_of_range)
+        self.untagged_count += untagged
+
+    def _scan_range(self, start: int, end: int) -> None:
+        """Run the streaming scan over the byte range [start, end).
+
+        A line belongs to the range that contains its first byte: when start
+        falls mid-line the partial line is skipped (the previous range
+        finishes it), and the line straddling end is read to completion here.
+        Line numbers in warnings are relative to the scanned range.
+        """
+        # Cap maxsplit so fields past the ones we consume stay unsplit in the
+        # tail element; this avoids allocating a stripped string per field.
+        custom_maxsplit = len(self.log_field_names) - 1 if self.log_field_names else 0
+        dstport_index = self._custom_dstport_index
+        protocol_index = self._custom_protocol_index
+        unknown_fields = self._custom_unknown_fields
+
+        # Hoist attribute lookups out of the hot loop: each self.X access is
+        # a dict lookup per iteration in CPython, so bind everything the
+        # loop needs (including the counters) to locals and write the
+        # counters back once at the end.
+        field_names = self.log_field_names
+        field_mapping = self.FIELD_MAPPING
+        delimiter_bytes = self.delimiter_bytes
+        update_pair_counts = self.port_protocol_counts.update
+        update_tag_counts = self.tag_counts.update
+        rules_get = self.mapping_rules.get
+        find_default_fields = self._default_line_re.findall
+        count_lines_compiled = _count_lines_compiled
+        mapping_rules = self.mapping_rules
+        pair_counts_dict = self.port_protocol_counts
+        tag_counts_dict = self.tag_counts
+        warn = logging.warning
+        verbose = self.verbose
+        processed = 0
+        skipped = 0
+        skipped_field_mismatch = 0
+        skipped_unknown_field = 0
+        skipped_missing_port = 0
+        untagged = 0
+        # Per-chunk key buffer: Counter.update over a list runs in C,
+        # which beats three dict operations per line. The list is reused
+        # across chunks to avoid reallocation.
+        keys = []
+        append_key = keys.append
+
+        file_size = os.path.getsize(self.flow_log_file)
+        if file_size == 0 or start >= end:
+            return
+
+        fd = os.open(self.flow_log_file, os.O_RDONLY)
+        try:
+            # Tell the kernel up front that this is one strictly sequential
+            # pass whose pages need not be kept afterwards: SEQUENTIAL widens
+            # readahead, NOREUSE lets the cache drop pages behind the scan.
+            # Both are advisory and absent on some platforms.
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    if hasattr(os, 'POSIX_FADV_NOREUSE'):
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
+                except OSError:
+                    pass
+            # Map the file instead of read(): slices come straight out of the
+            # page cache with no copy into Python read buffers, and random
+            # access makes the range bookkeeping trivial.
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        try:
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                # One strictly sequential pass: let the kernel read ahead
+                # aggressively.
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            offset = start
+            if start:
+                # The partial line containing start belongs to the previous
+                # range; searching from one byte early means a range that
+                # begins exactly on a line start skips nothing.
+                newline_pos = mm.find(b'\n', start - 1)
+                if newline_pos == -1:
+                    return
+                offset = newline_pos + 1
+            if offset >= end:
+                return
+            # The line containing byte end - 1 is completed by this range.
+            newline_pos = mm.find(b'\n', end - 1)
+            scan_end = file_size if newline_pos == -1 else newline_pos
+
+            line_number = 0
+            position = offset
+            while position < scan_end:
+                # Carve the map into chunk-sized slices aligned to line ends
+                # and split each slice with one C-level splitlines call.
+                chunk_end = position + self.READ_CHUNK_SIZE
+                if chunk_end >= scan_end:
+                    chunk_end = scan_end
+                else:
+                    newline_pos = mm.find(b'\n', chunk_end)
+                    if newline_pos == -1 or newline_pos > scan_end:
+                        chunk_end = scan_end
+                    else:
+                        chunk_end = newline_pos
+                chunk = mm[position:chunk_end]
+                position = chunk_end + 1
+
+                if not field_names:
+                    if count_lines_compiled is not None:
+                        # Cython extension: split, pack and count the whole
+                        # chunk without touching the bytecode interpreter.
+                        counted, bad, unmatched = count_lines_compiled(
+                            chunk, delimiter_bytes, mapping_rules,
+                            pair_counts_dict, tag_counts_dict)
+                        processed += counted
+                        skipped += bad
+                        untagged += unmatched
+                        continue
+                    # Default V2 flow log format: extract dstport/protocol
+                    # from every well-formed line in the chunk with one
+                    # findall; anything unmatched is malformed.
+                    processed += chunk.count(b'\n') + 1
+                    matches = find_default_fields(chunk)
+                    skipped += chunk.count(b'\n') + 1 - len(matches)
+                    for port_bytes, proto_bytes in matches:
+                        dstport = int(port_bytes)
+                        protocol_number = int(proto_bytes)
+                        if dstport <= 65535 and protocol_number <= 255:
+                            # One small-int key per line instead of a
+                            # (str, str) tuple: a single hash, no tuple
+                            # allocation.
+                            append_key((dstport << 8) | protocol_number)
                         else:
-                            logging.warning(f"Line {line_number}: Malformed default v2 line. Skipped.")
-                            self.skipped_lines += 1
+                            skipped += 1
+                else:
+                    # Custom layout specialized at __init__: the two column
+                    # indices the counts need are baked in, so each line is
+                    # one split plus two int() calls - no per-line dict and
+                    # no per-field type dispatch for fields nothing reads.
+                    for line in chunk.splitlines():
+                        line_number += 1
+                        processed += 1
+
+                        # The capped split folds any extra trailing fields
+                        # into the tail element, so a delimiter surviving
+                        # there means the line is wider than the layout.
+                        parts = line.split(delimiter_bytes, custom_maxsplit)
+                        if (len(parts) != len(field_names)
+                                or delimiter_bytes in parts[-1]):
+                            if verbose:
+                                warn(f"Line {line_number}: Field count mismatch. Skipped.")
+                            skipped_field_mismatch += 1
                             continue
+                        if unknown_fields:
+                            if verbose:
+                                for field_name in field_names:
+                                    if field_name not in field_mapping:
+                                        warn(f"Line {line_number}: Unknown field name: {field_name}. Skipped.")
+                            skipped_unknown_field += unknown_fields
+                        # int() tolerates surrounding whitespace and rejects
+                        # '-', so the two integer columns get the same
+                        # sanitization the old per-field conversion applied,
+                        # without building a log entry.
+                        try:
+                            dstport = int(parts[dstport_index]) if dstport_index >= 0 else None
+                        except ValueError:
+                            dstport = None
+                        try:
+                            protocol_number = int(parts[protocol_index]) if protocol_index >= 0 else None
+                        except ValueError:
+                            protocol_number = None
 
-                    if dstport and protocol_name:
-                        # Store counts using both protocol number and name for debugging
-                        self.port_protocol_counts[(dstport, protocol_name)] += 1
-                        
-                        # Look up tag using protocol name (from mapping file)
-                        tag = self.mapping_rules.get((dstport, protocol_name))
-                        if tag:
-                            self.tag_counts[tag] += 1
+                        if (dstport is not None and protocol_number is not None
+                                and 0 <= dstport <= 65535 and 0 <= protocol_number <= 255):
+                            append_key((dstport << 8) | protocol_number)
                         else:
-                            # If not found with protocol name, log for debugging
-                            logging.debug(f"Line {line_number}: No tag for port={dstport}, protocol={protocol_name} (number={protocol_number})")
-                            self.untagged_count += 1
-                    else:
-                        logging.warning(f"Line {line_number}: Missing dstport or protocol. Skipped.")
-                        self.skipped_lines += 1
+                            if verbose:
+                                warn(f"Line {line_number}: Missing dstport or protocol. Skipped.")
+                            skipped_missing_port += 1
+
+                if keys:
+                    update_pair_counts(keys)
+                    tags = list(map(rules_get, keys))
+                    update_tag_counts(tag for tag in tags if tag is not None)
+                    untagged += tags.count(None)
+                    keys.clear()
+        finally:
+            mm.close()
+
+        # One summary warning per skip category; per-line detail (with line
+        # numbers) is available behind --verbose, so the common corrupt-file
+        # case pays no logging dispatch in the hot loop.
+        if skipped and not field_names:
+            warn(f"Skipped {skipped} malformed default-format lines.")
+        if skipped_field_mismatch:
+            warn("Skipped %d lines with a field count mismatch.",
+                 skipped_field_mismatch)
+        if skipped_unknown_field:
+            warn("Skipped %d field values with an unknown field name.",
+                 skipped_unknown_field)
+        if skipped_missing_port:
+            warn("Skipped %d lines with missing or invalid dstport/protocol.",
+                 skipped_missing_port)
+        self.processed_lines += processed
+        self.skipped_lines += (skipped + skipped_field_mismatch
+                               + skipped_unknown_field + skipped_missing_port)
+        self.untagged_count += untagged
+
+    def _process_flow_logs_parallel(self) -> None:
+        """Fan the streaming scan out over worker processes.
+
+        The file is partitioned into one byte range per worker; each worker
+        runs _scan_range on its slice with the already-expanded rule dict and
+        the partial counters are merged here.
+        """
+        file_size = os.path.getsize(self.flow_log_file)
+        bounds = [file_size * i // self.workers for i in range(self.workers + 1)]
+        ranges = [(bounds[i], bounds[i + 1])
+                  for i in range(self.workers) if bounds[i] < bounds[i + 1]]
+        if not ranges:
+            return
+
+        with ProcessPoolExecutor(
+                max_workers=len(ranges), initializer=_init_scan_worker,
+                initargs=(self.flow_log_file, self.delimiter,
+                          self.log_field_names, self.mapping_rules,
+                          self.verbose)) as pool:
+            for tag_counts, pair_counts, untagged, processed, skipped in pool.map(
+                    _scan_range_worker, ranges):
+                self.tag_counts.update(tag_counts)
+                self.port_protocol_counts.update(pair_counts)
+                self.untagged_count += untagged
+                self.processed_lines += processed
+                self.skipped_lines += skipped
+
+    def process_flow_logs(self) -> None:
+        """Process the flow logs and update the tag counts and port/protocol combination counts."""
+        try:
+            if not os.path.isfile(self.flow_log_file):
+                raise FileNotFoundError(f"Flow log file '{self.flow_log_file}' not found.")
+
+            if self.workers > 1:
+                self._process_flow_logs_parallel()
+                return
+
+            if not self.log_field_names:
+                # Vectorized fast path for the default format when pandas is
+                # available; falls through on files its C parser rejects.
+                if (pd is not None and np is not None
+                        and self._process_flow_logs_pandas()):
+                    return
+                # Compiled fast path when Numba is available.
+                if njit is not None:
+                    self._process_flow_logs_packed()
+                    return
+
+            self._scan_range(0, os.path.getsize(self.flow_log_file))
 
         except FileNotFoundError as e:
             logging.error(f"Flow log error: {e}")
@@ -211,17 +701,25 @@ class FlowLogProcessor:
     def generate_reports(self) -> None:
         """Generate reports and write to the output file."""
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as outfile:
+            effective_names = self._effective_protocol_names()
+            rows = sorted(
+                (str(key >> 8), effective_names[key & 0xFF].decode('ascii'), count)
+                for key, count in self.port_protocol_counts.items())
+
+            # csv.writer.writerows formats and emits whole sections in C -
+            # no per-row f-string assembly - and the large buffer keeps the
+            # write syscall count low for high-cardinality outputs.
+            with open(self.output_file, 'w', encoding='utf-8',
+                      buffering=1 << 20, newline='') as outfile:
+                writer = csv.writer(outfile, lineterminator='\n')
                 outfile.write("Tag Counts:\n")
-                outfile.write("Tag,Count\n")
-                for tag, count in sorted(self.tag_counts.items()):
-                    outfile.write(f"{tag},{count}\n")
-                outfile.write(f"Untagged,{self.untagged_count}\n\n")
+                writer.writerow(("Tag", "Count"))
+                writer.writerows(sorted(self.tag_counts.items()))
+                writer.writerow(("Untagged", self.untagged_count))
 
-                outfile.write("Port/Protocol Combination Counts:\n")
-                outfile.write("Port,Protocol,Count\n")
-                for (port, protocol), count in sorted(self.port_protocol_counts.items()):
-                    outfile.write(f"{port},{protocol},{count}\n")
+                outfile.write("\nPort/Protocol Combination Counts:\n")
+                writer.writerow(("Port", "Protocol", "Count"))
+                writer.writerows(rows)
 
                 outfile.write(f"\nProcessed Lines: {self.processed_lines}\n")
                 outfile.write(f"Skipped Lines: {self.skipped_lines}\n")
@@ -241,6 +739,35 @@ class FlowLogProcessor:
         except Exception as e:
             logging.error(f"Flow log processing failed: {e}")
 
+# Per-process state for the parallel scan; set once by the pool initializer so
+# the expanded rule dict is not re-pickled for every range.
+_scan_processor: Optional[FlowLogProcessor] = None
+
+
+def _init_scan_worker(flow_log_file, delimiter, log_field_names, mapping_rules,
+                      verbose=False):
+    global _scan_processor
+    _scan_processor = FlowLogProcessor(flow_log_file, '', '',
+                                       delimiter=delimiter,
+                                       log_field_names=log_field_names,
+                                       verbose=verbose)
+    _scan_processor.mapping_rules = mapping_rules
+
+
+def _scan_range_worker(byte_range):
+    start, end = byte_range
+    processor = _scan_processor
+    processor.tag_counts = Counter()
+    processor.port_protocol_counts = Counter()
+    processor.untagged_count = 0
+    processor.processed_lines = 0
+    processor.skipped_lines = 0
+    processor._scan_range(start, end)
+    return (processor.tag_counts, processor.port_protocol_counts,
+            processor.untagged_count, processor.processed_lines,
+            processor.skipped_lines)
+
+
 if __name__ == "__main__":
     """
     Example usage: 
@@ -253,6 +780,10 @@ if __name__ == "__main__":
     parser.add_argument("--delimiter", default=" ", help="Delimiter for flow log file.")
     parser.add_argument("--log_field_names", nargs='+', help="Field names for custom log format.")
     parser.add_argument("--protocol_mapping_file", help="Path to IANA protocol mapping CSV file.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes for the scan.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log a warning for every skipped line instead of one summary per category.")
     args = parser.parse_args()
 
     processor = FlowLogProcessor(
@@ -261,6 +792,8 @@ if __name__ == "__main__":
         args.output_file,
         delimiter=args.delimiter,
         log_field_names=args.log_field_names,
-        protocol_mapping_file=args.protocol_mapping_file
+        protocol_mapping_file=args.protocol_mapping_file,
+        workers=args.workers,
+        verbose=args.verbose
     )
     processor.run()
\ No newline at end of file
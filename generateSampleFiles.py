@@ -1,14 +1,77 @@
 import csv
+import gzip
+import io
 import random
 import os
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import List, Dict, Any, Tuple
 
+# Optional vectorized generation: drawing whole columns with NumPy replaces
+# ~14 Python-level random calls per record with one RNG call per field per
+# file. The scalar path below remains the fallback.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional C-extension JSON encoder for the JSON output file; the stdlib
+# json module remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional compiled loop for the uniform integer columns.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional Arrow CSV writer: formats and streams whole columns in C++,
+# replacing the Python-level astype('U') / np.char.add line fold.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _gen_int_block(srcports, packets, byte_counts, starts, ends):
+        """Fill the five uniform integer columns in one compiled loop.
+
+        Draws from Numba's internal RNG, so it is only used for unseeded
+        runs; seeded runs stay on the shared Generator for reproducibility.
+        """
+        for i in range(srcports.shape[0]):
+            srcports[i] = np.random.randint(1024, 65536)
+            packets[i] = np.random.randint(1, 10001)
+            byte_counts[i] = np.random.randint(64, 1500001)
+            starts[i] = np.random.randint(1612345600, 1614937601)
+            ends[i] = np.random.randint(1612345600, 1614937601)
+else:
+    _gen_int_block = None
+
 class FlowLogGenerator:
     """Generate AWS VPC Flow Logs in different versions and formats."""
-    
-    def __init__(self):
+
+    # Column sets kept in the _prefill_columns memo before the oldest is
+    # evicted; each entry holds one file's worth of arrays.
+    COLUMN_CACHE_SIZE = 8
+
+    # Bytes accumulated in the scalar fallback loops before flushing: rows
+    # are appended to one reusable bytearray, so each flush is a single
+    # write call and no per-batch joined string is ever allocated.
+    WRITE_BUFFER_SIZE = 1 << 20
+
+    def __init__(self, seed: int = None):
+        # Seed both RNGs when asked: parallel workers get one seed per task
+        # so each output file is reproducible and independently random.
+        if seed is not None:
+            random.seed(seed)
+        self._seed = seed
         # Base field definitions with their data types and generation functions
         self.field_definitions = {
             # Version 2 fields
@@ -67,31 +130,32 @@ class FlowLogGenerator:
         # Common ports for realistic distribution
         self.common_ports = [22, 25, 53, 80, 110, 123, 143, 443, 465, 993, 995, 3306, 3389, 5432, 8080]
         
-        # Define field sets for each version
+        # Define field sets for each version (tuples: immutable and
+        # slightly faster to iterate than lists)
         self.version_fields = {
-            2: [
+            2: (
                 "version", "account-id", "interface-id", "srcaddr", "dstaddr", "srcport", 
                 "dstport", "protocol", "packets", "bytes", "start", "end", "action", "log-status"
-            ],
-            3: [
+            ),
+            3: (
                 "version", "account-id", "interface-id", "srcaddr", "dstaddr", "srcport", 
                 "dstport", "protocol", "packets", "bytes", "start", "end", "action", "log-status",
                 "vpc-id", "subnet-id", "instance-id", "tcp-flags", "type", "pkt-srcaddr", "pkt-dstaddr"
-            ],
-            4: [
+            ),
+            4: (
                 "version", "account-id", "interface-id", "srcaddr", "dstaddr", "srcport", 
                 "dstport", "protocol", "packets", "bytes", "start", "end", "action", "log-status",
                 "vpc-id", "subnet-id", "instance-id", "tcp-flags", "type", "pkt-srcaddr", "pkt-dstaddr",
                 "region", "az-id", "sublocation-type", "sublocation-id"
-            ],
-            5: [
+            ),
+            5: (
                 "version", "account-id", "interface-id", "srcaddr", "dstaddr", "srcport", 
                 "dstport", "protocol", "packets", "bytes", "start", "end", "action", "log-status",
                 "vpc-id", "subnet-id", "instance-id", "tcp-flags", "type", "pkt-srcaddr", "pkt-dstaddr",
                 "region", "az-id", "sublocation-type", "sublocation-id",
                 "pkt-src-aws-service", "pkt-dst-aws-service", "flow-direction", "traffic-path"
-            ],
-            7: [
+            ),
+            7: (
                 "version", "account-id", "interface-id", "srcaddr", "dstaddr", "srcport", 
                 "dstport", "protocol", "packets", "bytes", "start", "end", "action", "log-status",
                 "vpc-id", "subnet-id", "instance-id", "tcp-flags", "type", "pkt-srcaddr", "pkt-dstaddr",
@@ -100,28 +164,54 @@ class FlowLogGenerator:
                 "ecs-cluster-arn", "ecs-cluster-name", "ecs-container-instance-arn", "ecs-container-instance-id",
                 "ecs-container-id", "ecs-second-container-id", "ecs-service-name", "ecs-task-definition-arn",
                 "ecs-task-arn", "ecs-task-id", "reject-reason"
-            ]
+            )
         }
         
         # Custom field sets for specific testing scenarios
         self.custom_field_sets = {
-            "network_security": [
+            "network_security": (
                 "account-id", "vpc-id", "srcaddr", "dstaddr", "srcport", "dstport", 
                 "protocol", "action", "tcp-flags", "flow-direction"
-            ],
-            "traffic_analysis": [
+            ),
+            "traffic_analysis": (
                 "start", "end", "srcaddr", "dstaddr", "packets", "bytes", 
                 "flow-direction", "traffic-path", "pkt-src-aws-service", "pkt-dst-aws-service"
-            ],
-            "container_tracking": [
+            ),
+            "container_tracking": (
                 "account-id", "vpc-id", "srcaddr", "dstaddr", "srcport", "dstport", 
                 "protocol", "action", "ecs-cluster-name", "ecs-service-name", "ecs-task-id"
-            ],
-            "minimal": [
+            ),
+            "minimal": (
                 "srcaddr", "dstaddr", "dstport", "protocol", "action"
-            ]
+            )
         }
-        
+
+        # Integer-ID view of the schema: each field gets an index into a
+        # flat generator tuple, so the scalar row loops index a tuple per
+        # field instead of hashing a name into field_definitions.
+        self.field_ids = {name: i
+                          for i, name in enumerate(self.field_definitions)}
+        self.field_generators = tuple(
+            gen for _dtype, gen in self.field_definitions.values())
+        self.version_field_ids = {
+            version: tuple(self.field_ids[name] for name in names)
+            for version, names in self.version_fields.items()}
+        self.custom_field_ids = {
+            set_name: tuple(self.field_ids[name] for name in names
+                            if name in self.field_ids)
+            for set_name, names in self.custom_field_sets.items()}
+
+        # Compiled row renderers, keyed by (field-ID tuple, version);
+        # filled lazily by _row_renderer.
+        self._row_renderers = {}
+
+        # Recently drawn column sets, keyed by (fields, n, version): when
+        # several outputs need the exact same schema and row count (mixed
+        # plus a per-version file, or repeated seeded runs), the columns
+        # are drawn once and reused.
+        self._column_cache = {}
+
+
         # Define protocol name to number mapping based on IANA protocol numbers
         # Comprehensive mapping from the IANA registry
         self.protocol_map = {
@@ -158,10 +248,303 @@ class FlowLogGenerator:
         
         # Reverse mapping (number to name) for generating logs
         self.number_to_protocol = {v: k for k, v in self.protocol_map.items()}
-        
+
+        if np is not None:
+            self.rng = np.random.default_rng(seed)
+            self.vector_field_definitions = self._build_vector_field_definitions()
+
+    def _build_vector_field_definitions(self) -> Dict[str, Any]:
+        """Column-oriented equivalents of field_definitions.
+
+        Each entry maps a field name to a callable taking a row count and
+        returning a whole column of values drawn with batched NumPy RNG
+        calls instead of one random.* call per record.
+        """
+        rng = self.rng
+
+        # Columns stay NumPy arrays wherever the values need no Python-level
+        # string assembly: no tolist() materialization of an N-element list
+        # of boxed ints per field, and downstream batch formatting can
+        # consume the arrays directly.
+        # Numeric columns carry the narrowest dtype their value range
+        # allows: less memory traffic per column, and the astype('U')
+        # stringification loop reads fewer bytes per value.
+        def ints(lo: int, hi: int, n: int, dtype=np.int64):
+            return rng.integers(lo, hi, n, dtype=dtype)
+
+        def choice_column(options, dtype=object):
+            # Convert the option pool to an array once here, at definition
+            # time, instead of on every column draw.
+            pool = np.array(options, dtype=dtype)
+            return lambda n: rng.choice(pool, n)
+
+        # The identifier-style fields (ENI, VPC, ARN, ...) only need
+        # plausible-looking uniqueness, so their strings are rendered once
+        # into a fixed pool here and columns are sampled from it - the
+        # f-string assembly cost is amortized over every row ever drawn.
+        pool_size = 8192
+
+        def pooled(make_values):
+            pool = np.array(make_values(pool_size), dtype=object)
+            return lambda n: rng.choice(pool, n)
+
+        def pooled_or_dash(make_values):
+            # Half the pool is '-', so a uniform draw keeps the scalar
+            # random.choice([value, '-']) fifty-fifty split.
+            values = make_values(pool_size // 2)
+            pool = np.array(list(values) + ["-"] * (pool_size // 2),
+                            dtype=object)
+            return lambda n: rng.choice(pool, n)
+
+        # 256-entry octet string table: fancy-indexing it converts a whole
+        # (n, 2) octet draw to strings in one gather, and np.char.add then
+        # assembles the addresses in C instead of one f-string per row.
+        octet_strings = np.array([str(i) for i in range(256)])
+
+        def ip_addresses(n: int):
+            octets = octet_strings[rng.integers(0, 256, (n, 2))]
+            return np.char.add(
+                np.char.add(np.char.add("172.31.", octets[:, 0]), "."),
+                octets[:, 1])
+
+        common_port_pool = np.array(self.common_ports, dtype=np.uint16)
+
+        def dstports(n: int):
+            # Scalar version picks uniformly from common_ports plus one fresh
+            # random port: draw an index over len+1 slots and substitute a
+            # random port where the extra slot was hit.
+            pool = common_port_pool
+            index = rng.integers(0, len(pool) + 1, n)
+            random_ports = rng.integers(1024, 65536, n, dtype=np.uint16)
+            return np.where(index < len(pool),
+                            pool[np.minimum(index, len(pool) - 1)],
+                            random_ports)
+
+        return {
+            "version": choice_column([2, 3, 4, 5, 7]),
+            "account-id": lambda n: ints(100000000000, 1000000000000, n),
+            "interface-id": pooled(lambda k: [f"eni-{a}b8ca{b}" for a, b in zip(
+                ints(1000000, 10000000, k), ints(100000000, 1000000000, k))]),
+            "srcaddr": ip_addresses,
+            "dstaddr": ip_addresses,
+            "srcport": lambda n: ints(1024, 65536, n, np.uint16),
+            "dstport": dstports,
+            "protocol": choice_column([6, 17, 1], dtype=np.uint8),
+            "packets": lambda n: ints(1, 10001, n, np.uint16),
+            "bytes": lambda n: ints(64, 1500001, n, np.uint32),
+            "start": lambda n: ints(1612345600, 1612345600 + 86400 * 30 + 1, n,
+                                    np.uint32),
+            "end": lambda n: ints(1612345600, 1612345600 + 86400 * 30 + 1, n,
+                                  np.uint32),
+            "action": choice_column(["ACCEPT", "REJECT"]),
+            "log-status": choice_column(["OK", "NODATA", "SKIPDATA"]),
+            "vpc-id": pooled(lambda k: [f"vpc-{v}" for v in ints(1000000, 10000000, k)]),
+            "subnet-id": pooled(lambda k: [f"subnet-{v}" for v in ints(1000000, 10000000, k)]),
+            "instance-id": pooled_or_dash(
+                lambda k: [f"i-{v}" for v in ints(1000000, 10000000, k)]),
+            "tcp-flags": choice_column([0, 1, 2, 4, 18, 19], dtype=np.uint8),
+            "type": choice_column(["IPv4", "IPv6"]),
+            "pkt-srcaddr": ip_addresses,
+            "pkt-dstaddr": ip_addresses,
+            "region": choice_column(["us-east-1", "us-west-2", "eu-west-1", "ap-northeast-1"]),
+            "az-id": pooled_or_dash(
+                lambda k: [f"use1-az{v}" for v in ints(1, 7, k)]),
+            "sublocation-type": choice_column(["wavelength", "outpost", "localzone", "-"]),
+            "sublocation-id": pooled_or_dash(
+                lambda k: [f"subnet-{v}" for v in ints(1000000, 10000000, k)]),
+            "pkt-src-aws-service": choice_column(["AMAZON", "S3", "DYNAMODB", "EC2", "-"]),
+            "pkt-dst-aws-service": choice_column(["AMAZON", "S3", "DYNAMODB", "EC2", "-"]),
+            "flow-direction": choice_column(["ingress", "egress"]),
+            # All strings: a pool mixing ints and "-" renders the same text
+            # but cannot be converted to a typed Arrow array.
+            "traffic-path": choice_column(["1", "2", "3", "4", "5", "6",
+                                           "7", "8", "-"]),
+            "ecs-cluster-arn": pooled_or_dash(
+                lambda k: [f"arn:aws:ecs:region:account:cluster/cluster-{v}"
+                           for v in ints(1000, 10000, k)]),
+            "ecs-cluster-name": pooled_or_dash(
+                lambda k: [f"cluster-{v}" for v in ints(1000, 10000, k)]),
+            "ecs-container-instance-arn": pooled_or_dash(
+                lambda k: [f"arn:aws:ecs:region:account:container-instance/{v}"
+                           for v in ints(1000000, 10000000, k)]),
+            "ecs-container-instance-id": pooled_or_dash(
+                lambda k: [str(v) for v in ints(1000000, 10000000, k)]),
+            "ecs-container-id": pooled_or_dash(
+                lambda k: [str(v) for v in ints(1000000, 10000000, k)]),
+            "ecs-second-container-id": pooled_or_dash(
+                lambda k: [str(v) for v in ints(1000000, 10000000, k)]),
+            "ecs-service-name": pooled_or_dash(
+                lambda k: [f"service-{v}" for v in ints(1000, 10000, k)]),
+            "ecs-task-definition-arn": pooled_or_dash(
+                lambda k: [f"arn:aws:ecs:region:account:task-definition/task-{v}"
+                           for v in ints(1000, 10000, k)]),
+            "ecs-task-arn": pooled_or_dash(
+                lambda k: [f"arn:aws:ecs:region:account:task/{v}"
+                           for v in ints(1000000, 10000000, k)]),
+            "ecs-task-id": pooled_or_dash(
+                lambda k: [str(v) for v in ints(1000000, 10000000, k)]),
+            "reject-reason": choice_column(["BPA", "-"]),
+        }
+
+    def _prefill_columns(self, fields: List[str], n: int,
+                         version: int = None) -> Dict[str, Any]:
+        """Pre-draw one column of n values per field (SoA layout).
+
+        Integer-valued columns come back as NumPy arrays straight from the
+        RNG; only fields that need Python string assembly are lists.
+
+        Results are memoized per (fields, n, version): an identical
+        request from another output file reuses the materialized columns
+        instead of re-drawing them. Readers never mutate the columns, so
+        sharing is safe.
+        """
+        key = (tuple(fields), n, version)
+        cached = self._column_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # When the compiled block is available (and the run is unseeded),
+        # the five uniform integer columns are filled by one Numba loop
+        # instead of five separate Generator calls.
+        block_fields = ("srcport", "packets", "bytes", "start", "end")
+        block = {}
+        if (_gen_int_block is not None and self._seed is None
+                and any(field in block_fields for field in fields)):
+            arrays = tuple(np.empty(n, dtype=np.int64) for _ in block_fields)
+            _gen_int_block(*arrays)
+            block = dict(zip(block_fields, arrays))
+
+        columns = {}
+        for field in fields:
+            if field == "version" and version is not None:
+                columns[field] = [version] * n
+            elif field in block:
+                columns[field] = block[field]
+            else:
+                columns[field] = self.vector_field_definitions[field](n)
+
+        if len(self._column_cache) >= self.COLUMN_CACHE_SIZE:
+            self._column_cache.pop(next(iter(self._column_cache)))
+        self._column_cache[key] = columns
+        return columns
+
+    def _render_lines(self, fields: List[str], n: int,
+                      version: int = None):
+        """Generate n complete rows as one array of space-joined lines.
+
+        Stays column-oriented all the way to the line fold: each column is
+        converted to strings in one C loop (astype('U')) and the columns
+        are folded into complete lines with np.char.add, replacing the
+        per-row " ".join(map(str, row)) and its n * len(fields) str()
+        calls with len(fields) array passes.
+        """
+        columns = self._prefill_columns(fields, n, version)
+        lines = None
+        for field in fields:
+            column = np.asarray(columns[field]).astype('U')
+            if lines is None:
+                lines = column
+            else:
+                lines = np.char.add(np.char.add(lines, " "), column)
+        return lines
+
+    def _write_rows_vectorized(self, f, fields: List[str], n: int,
+                               version: int = None,
+                               header: bytes = None) -> None:
+        """Generate and write n rows column-wise in one batch."""
+        if n <= 0:
+            if header:
+                f.write(header)
+            return
+        if pa is not None:
+            # Arrow's CSV writer formats every column in C++ and streams
+            # encoded bytes straight to the handle, skipping the Python
+            # string conversions and the line fold entirely. quoting_style
+            # "none" is required: the default quotes every string field,
+            # which would break the space-delimited format. If a column
+            # cannot be converted (or this pyarrow lacks quoting_style),
+            # fall through to the NumPy fold instead of aborting the file.
+            columns = self._prefill_columns(fields, n, version)
+            try:
+                table = pa.table({field: pa.array(np.asarray(columns[field]))
+                                  for field in fields})
+                options = pa_csv.WriteOptions(include_header=False,
+                                              delimiter=" ",
+                                              quoting_style="none")
+            except Exception:
+                table = None
+            if table is not None:
+                # Arrow quotes header names even with quoting_style "none",
+                # so the pre-encoded header is written directly.
+                if header:
+                    f.write(header)
+                pa_csv.write_csv(table, f, write_options=options)
+                return
+        lines = self._render_lines(fields, n, version)
+        body = ("\n".join(lines.tolist()) + "\n").encode("ascii")
+        self._write_blocks(f, (header, body) if header else (body,))
+
+    def _slot_generators(self, ids: Tuple[int, ...],
+                         version: int = None) -> List:
+        """Per-row value generators for a field-ID tuple, with the version
+        slot (when present) pinned to the requested version."""
+        slots = [self.field_generators[i] for i in ids]
+        version_id = self.field_ids["version"]
+        if version is not None and version_id in ids:
+            slots[ids.index(version_id)] = lambda: version
+        return slots
+
+    def _row_renderer(self, ids: Tuple[int, ...], version: int = None):
+        """Return a compiled row renderer for one field-ID schema.
+
+        The renderer is exec-generated straight-line code — one f-string
+        placeholder per field, generators bound as closure variables — so
+        rendering a row is a single call with no per-field loop, list
+        build, or join. Compiled once per schema and cached.
+        """
+        key = (ids, version)
+        renderer = self._row_renderers.get(key)
+        if renderer is None:
+            slots = self._slot_generators(ids, version)
+            names = ", ".join("g%d" % i for i in range(len(slots)))
+            placeholders = " ".join("{g%d()}" % i for i in range(len(slots)))
+            source = (
+                "def _make(slots):\n"
+                f"    {names}, = slots\n"
+                "    def _render():\n"
+                f"        return f\"{placeholders}\\n\"\n"
+                "    return _render\n"
+            )
+            namespace = {}
+            exec(source, namespace)
+            renderer = namespace["_make"](slots)
+            self._row_renderers[key] = renderer
+        return renderer
+
+    def _write_scalar_rows(self, f, ids: Tuple[int, ...], n: int,
+                           version: int = 2,
+                           header: bytes = None) -> None:
+        """Scalar-RNG fallback: generate n records and accumulate rows in
+        one reusable bytearray, flushing in WRITE_BUFFER_SIZE chunks.
+
+        ids is a field-ID tuple from version_field_ids/custom_field_ids;
+        rows come from the compiled renderer for that schema — one call
+        per row, no record dict and no name hashing.
+        """
+        render = self._row_renderer(ids, version)
+        buf = bytearray(header or b"")
+        for _ in range(n):
+            buf += render().encode("ascii")
+            if len(buf) >= self.WRITE_BUFFER_SIZE:
+                self._write_blocks(f, (buf,))
+                del buf[:]
+        if buf:
+            self._write_blocks(f, (buf,))
+
     def generate_mapping_file(self, filename: str, num_entries: int = 20) -> None:
         """Generate a mapping file for port/protocol combinations."""
-        with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+        with open(filename, "w", newline="", encoding="utf-8",
+                  buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(["dstport", "protocol", "tag"])
             
@@ -194,16 +577,33 @@ class FlowLogGenerator:
                 ("sctp", 1)    # SCTP - 1% probability
             ]
             
-            for _ in range(num_entries - len(entries)):
-                port = random.randint(1024, 65535)
-                # Select protocol based on weighted probability
-                protocol = random.choices(
-                    [p[0] for p in protocols],
-                    weights=[p[1] for p in protocols]
-                )[0]
-                tag = f"{random.choice(services)}_svc{random.randint(1, 99)}"
-                entries.append((port, protocol, tag))
-                
+            extra = num_entries - len(entries)
+            if extra > 0 and np is not None:
+                # One batched draw per column instead of four random.* calls
+                # per extra entry.
+                rng = self.rng
+                proto_names = [p[0] for p in protocols]
+                weights = np.array([p[1] for p in protocols], dtype=np.float64)
+                ports = rng.integers(1024, 65536, extra)
+                proto_idx = rng.choice(len(protocols), extra,
+                                       p=weights / weights.sum())
+                service_idx = rng.integers(0, len(services), extra)
+                tag_nums = rng.integers(1, 100, extra)
+                entries.extend(
+                    (port, proto_names[i], f"{services[s]}_svc{t}")
+                    for port, i, s, t in zip(ports, proto_idx,
+                                             service_idx, tag_nums))
+            else:
+                for _ in range(extra):
+                    port = random.randint(1024, 65535)
+                    # Select protocol based on weighted probability
+                    protocol = random.choices(
+                        [p[0] for p in protocols],
+                        weights=[p[1] for p in protocols]
+                    )[0]
+                    tag = f"{random.choice(services)}_svc{random.randint(1, 99)}"
+                    entries.append((port, protocol, tag))
+
             writer.writerows(entries)
         
         print(f"Created mapping file: {filename} with {num_entries} entries")
@@ -211,105 +611,255 @@ class FlowLogGenerator:
     def generate_flow_log_entry(self, version: int = 2, custom_fields: List[str] = None) -> Dict[str, Any]:
         """Generate a single flow log entry with fields appropriate for the specified version."""
         
-        # Generate a base record with all possible fields
-        record = {}
-        for field, (_, generator) in self.field_definitions.items():
-            record[field] = generator()
-        
-        # For protocol field, always use numeric values based on IANA protocol numbers
-        if "protocol" in record:
-            # If it's already a string representation of a number, convert it
-            if isinstance(record["protocol"], str) and record["protocol"].isdigit():
-                record["protocol"] = int(record["protocol"])
-            # If it's a protocol name string, map it to its number
-            elif isinstance(record["protocol"], str) and record["protocol"].lower() in self.protocol_map:
-                record["protocol"] = self.protocol_map[record["protocol"].lower()]
-            # Make sure it's an integer between 0-255
-            if isinstance(record["protocol"], int):
-                record["protocol"] = max(0, min(record["protocol"], 255))
-            
-        # Adjust the version field to match the requested version
-        record["version"] = version
-            
         # Pick fields based on version or custom field set
         if custom_fields is not None:
             fields_to_include = custom_fields
         else:
             fields_to_include = self.version_fields.get(version, self.version_fields[2])
-            
-        # Create the final record with only the relevant fields
-        final_record = {field: record[field] for field in fields_to_include if field in record}
-        
-        return final_record
+
+        # Generate only the fields this record keeps: the old code drew all
+        # ~40 generators and then filtered down to 14-38, discarding
+        # 30-60% of the RNG work per record.
+        definitions = self.field_definitions
+        record = {field: definitions[field][1]()
+                  for field in fields_to_include if field in definitions}
+
+        # Adjust the version field to match the requested version
+        if "version" in record:
+            record["version"] = version
+
+        return record
     
-    def generate_flow_logs(self, 
-                          output_dir: str, 
-                          versions: List[int] = None, 
+    @staticmethod
+    def _open_log_file(filename: str):
+        """Open a log file for binary writing, gzip-compressing when the
+        target name ends in .gz.
+
+        Log content is pure ASCII, so the writers encode each batch in one
+        bulk pass and skip the TextIOWrapper layer entirely.
+        """
+        if filename.endswith(".gz"):
+            return gzip.open(filename, "wb")
+        # Unbuffered: every writer batches rows into >= 1 MiB blocks, so
+        # buffered IO would only add a userspace copy between the batch
+        # buffer and the write syscall.
+        return open(filename, "wb", buffering=0)
+
+    @staticmethod
+    def _write_blocks(f, blocks) -> None:
+        """Write a sequence of byte blocks to an open log file.
+
+        On an unbuffered regular file all blocks are submitted in one
+        os.writev call, so a header plus a row batch costs a single
+        syscall. Compressed or buffered targets, and platforms without
+        writev, fall back to one write per block.
+        """
+        if hasattr(os, "writev") and isinstance(f, io.RawIOBase):
+            fd = f.fileno()
+            pending = [memoryview(block) for block in blocks if len(block)]
+            while pending:
+                written = os.writev(fd, pending)
+                while pending and written >= len(pending[0]):
+                    written -= len(pending[0])
+                    pending.pop(0)
+                if written:
+                    pending[0] = pending[0][written:]
+            return
+        for block in blocks:
+            f.write(block)
+
+    def _write_version_file(self, filename: str, version: int,
+                            num_logs: int, include_csv_header: bool) -> str:
+        """Generate one version-specific log file; returns the status line."""
+        header = None
+        if include_csv_header:
+            header = (" ".join(self.version_fields[version]) + "\n").encode("ascii")
+        with self._open_log_file(filename) as f:
+            if np is not None:
+                self._write_rows_vectorized(f, self.version_fields[version],
+                                            num_logs, version=version,
+                                            header=header)
+            else:
+                self._write_scalar_rows(f, self.version_field_ids[version],
+                                        num_logs, version=version,
+                                        header=header)
+
+        return f"Created {num_logs} Version {version} flow logs in {filename}"
+
+    def _write_custom_file(self, filename: str, custom_set: str,
+                           num_logs: int, include_csv_header: bool) -> str:
+        """Generate one custom field set log file; returns the status line."""
+        fields = self.custom_field_sets[custom_set]
+
+        header = None
+        if include_csv_header:
+            header = (" ".join(fields) + "\n").encode("ascii")
+        with self._open_log_file(filename) as f:
+            if np is not None:
+                self._write_rows_vectorized(f, fields, num_logs, header=header)
+            else:
+                self._write_scalar_rows(f, self.custom_field_ids[custom_set],
+                                        num_logs, header=header)
+
+        return f"Created {num_logs} custom '{custom_set}' flow logs in {filename}"
+
+    def _write_mixed_file(self, filename: str, versions: List[int],
+                          num_logs: int) -> str:
+        """Generate a log file mixing all requested versions; returns the
+        status line."""
+        if np is not None:
+            with self._open_log_file(filename) as f:
+                self._write_mixed_vectorized(f, versions, num_logs)
+            return f"Created {num_logs} mixed version flow logs in {filename}"
+
+        # The version varies per row, so hoist one compiled renderer per
+        # version out of the loop rather than re-resolving the schema and
+        # building a record dict every iteration.
+        renderers = {version: self._row_renderer(
+                         self.version_field_ids[version], version)
+                     for version in versions}
+        with self._open_log_file(filename) as f:
+            buf = bytearray()
+            for _ in range(num_logs):
+                version = random.choice(versions)
+                buf += renderers[version]().encode("ascii")
+                if len(buf) >= self.WRITE_BUFFER_SIZE:
+                    self._write_blocks(f, (buf,))
+                    del buf[:]
+            if buf:
+                self._write_blocks(f, (buf,))
+
+        return f"Created {num_logs} mixed version flow logs in {filename}"
+
+    def _write_mixed_vectorized(self, f, versions: List[int],
+                                num_logs: int) -> None:
+        """Vectorized mixed-file body: draw every row's version up front,
+        render each version's rows through the column-wise pipeline, and
+        scatter them back into draw order.
+
+        One rng.choice call replaces num_logs random.choice calls, and
+        each version's group reuses the same SoA generation as the
+        per-version files instead of building one dict per row.
+        """
+        if num_logs <= 0:
+            return
+        chosen = self.rng.choice(np.asarray(versions), size=num_logs)
+        lines = np.empty(num_logs, dtype=object)
+        for version in versions:
+            mask = chosen == version
+            count = int(mask.sum())
+            if count:
+                lines[mask] = self._render_lines(
+                    self.version_fields[version], count, version=version)
+        body = ("\n".join(lines.tolist()) + "\n").encode("ascii")
+        self._write_blocks(f, (body,))
+
+    def _write_json_file(self, filename: str, versions: List[int],
+                         num_logs: int) -> str:
+        """Generate the JSON format log file; returns the status line."""
+        if orjson is not None:
+            # Stream one orjson-encoded record at a time into the array:
+            # encoding happens in C and no full records list is held in
+            # memory, unlike json.dump over a materialized list.
+            with open(filename, "wb") as f:
+                f.write(b"[")
+                for i in range(num_logs):
+                    version = random.choice(versions)
+                    record = self.generate_flow_log_entry(version=version)
+                    f.write(b",\n" if i else b"\n")
+                    f.write(orjson.dumps(record, option=orjson.OPT_INDENT_2))
+                f.write(b"\n]")
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                records = []
+                for _ in range(num_logs):
+                    version = random.choice(versions)
+                    record = self.generate_flow_log_entry(version=version)
+                    records.append(record)
+
+                json.dump(records, f, indent=2)
+
+        return f"Created {num_logs} flow logs in JSON format in {filename}"
+
+    def generate_flow_logs(self,
+                          output_dir: str,
+                          versions: List[int] = None,
                           custom_sets: List[str] = None,
                           mixed_file: bool = True,
                           num_logs_per_file: int = 10000,
-                          include_csv_header: bool = False) -> None:
-        """Generate flow log files for specified versions and custom field sets."""
-        
+                          include_csv_header: bool = False,
+                          workers: int = 1,
+                          compress: bool = False) -> None:
+        """Generate flow log files for specified versions and custom field sets.
+
+        With workers > 1 the output files - each an independent, CPU-bound
+        unit of work - are produced by a process pool, one task per file.
+        """
+
         os.makedirs(output_dir, exist_ok=True)
-        
+
         if versions is None:
             versions = [2]
-            
-        # Generate version-specific log files
+
+        # Flow log text is highly repetitive; compressing moves the cost
+        # from write bandwidth to CPU. The mapping CSV and JSON file stay
+        # uncompressed.
+        suffix = ".gz" if compress else ""
+
+        writers = {
+            "version": self._write_version_file,
+            "custom": self._write_custom_file,
+            "mixed": self._write_mixed_file,
+            "json": self._write_json_file,
+        }
+        tasks = []
         for version in versions:
-            filename = os.path.join(output_dir, f"flow_logs_v{version}.txt")
-            with open(filename, "w", encoding="utf-8") as f:
-                if include_csv_header:
-                    f.write(" ".join(self.version_fields[version]) + "\n")
-                    
-                for _ in range(num_logs_per_file):
-                    record = self.generate_flow_log_entry(version=version)
-                    f.write(" ".join(str(record[field]) for field in self.version_fields[version]) + "\n")
-                    
-            print(f"Created {num_logs_per_file} Version {version} flow logs in {filename}")
-                
-        # Generate custom field set log files
+            filename = os.path.join(output_dir, f"flow_logs_v{version}.txt{suffix}")
+            tasks.append(("version", (filename, version, num_logs_per_file,
+                                      include_csv_header)))
         if custom_sets:
             for custom_set in custom_sets:
                 if custom_set in self.custom_field_sets:
-                    filename = os.path.join(output_dir, f"flow_logs_custom_{custom_set}.txt")
-                    fields = self.custom_field_sets[custom_set]
-                    
-                    with open(filename, "w", encoding="utf-8") as f:
-                        if include_csv_header:
-                            f.write(" ".join(fields) + "\n")
-                            
-                        for _ in range(num_logs_per_file):
-                            record = self.generate_flow_log_entry(custom_fields=fields)
-                            f.write(" ".join(str(record[field]) for field in fields) + "\n")
-                            
-                    print(f"Created {num_logs_per_file} custom '{custom_set}' flow logs in {filename}")
-        
-        # Generate a mixed version log file if requested
+                    filename = os.path.join(output_dir, f"flow_logs_custom_{custom_set}.txt{suffix}")
+                    tasks.append(("custom", (filename, custom_set,
+                                             num_logs_per_file,
+                                             include_csv_header)))
         if mixed_file and len(versions) > 1:
-            filename = os.path.join(output_dir, "flow_logs_mixed.txt")
-            with open(filename, "w", encoding="utf-8") as f:
-                for _ in range(num_logs_per_file):
-                    version = random.choice(versions)
-                    record = self.generate_flow_log_entry(version=version)
-                    f.write(" ".join(str(record[field]) for field in self.version_fields[version]) + "\n")
-                    
-            print(f"Created {num_logs_per_file} mixed version flow logs in {filename}")
-        
-        # Generate a JSON format log file for completeness
+            filename = os.path.join(output_dir, f"flow_logs_mixed.txt{suffix}")
+            tasks.append(("mixed", (filename, versions, num_logs_per_file)))
+        # JSON file is smaller for readability
         filename = os.path.join(output_dir, "flow_logs_json.json")
-        with open(filename, "w", encoding="utf-8") as f:
-            records = []
-            for _ in range(num_logs_per_file // 10):  # Smaller for readability
-                version = random.choice(versions)
-                record = self.generate_flow_log_entry(version=version)
-                records.append(record)
-            
-            json.dump(records, f, indent=2)
-            
-        print(f"Created {num_logs_per_file // 10} flow logs in JSON format in {filename}")
+        tasks.append(("json", (filename, versions, num_logs_per_file // 10)))
+
+        if workers > 1 and len(tasks) > 1:
+            # One independent seed per file keeps parallel output as
+            # reproducible as a serial run with the same seeds would be.
+            seeds = [random.randrange(2 ** 32) for _ in tasks]
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                futures = [pool.submit(_generate_file_worker, kind, args, seed)
+                           for (kind, args), seed in zip(tasks, seeds)]
+                for future in as_completed(futures):
+                    print(future.result())
+        else:
+            for kind, args in tasks:
+                print(writers[kind](*args))
                 
+def _generate_file_worker(kind: str, args: tuple, seed: int) -> str:
+    """Produce one output file in a worker process.
+
+    Builds a fresh generator seeded for this task; the parent only ships the
+    small task tuple, not generator state.
+    """
+    generator = FlowLogGenerator(seed=seed)
+    writer = {
+        "version": generator._write_version_file,
+        "custom": generator._write_custom_file,
+        "mixed": generator._write_mixed_file,
+        "json": generator._write_json_file,
+    }[kind]
+    return writer(*args)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate AWS VPC Flow Logs for testing")
     parser.add_argument("--output_dir", default="flow_logs", help="Directory to store generated log files")
@@ -323,10 +873,17 @@ def main():
     parser.add_argument("--no_mixed", action="store_false", dest="mixed_file", 
                         help="Don't generate a mixed-version log file")
     parser.add_argument("--include_headers", action="store_true", help="Include CSV headers in log files")
-    
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes; each output file is one task")
+    parser.add_argument("--compress", action="store_true",
+                        help="Write log files gzip-compressed (.txt.gz)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed the RNGs for reproducible output; "
+                             "parallel per-file seeds derive from it too")
+
     args = parser.parse_args()
-    
-    generator = FlowLogGenerator()
+
+    generator = FlowLogGenerator(seed=args.seed)
     
     # Generate mapping file
     generator.generate_mapping_file(args.mapping_file)
@@ -338,7 +895,9 @@ def main():
         custom_sets=args.custom_sets,
         mixed_file=args.mixed_file,
         num_logs_per_file=args.logs_per_file,
-        include_csv_header=args.include_headers
+        include_csv_header=args.include_headers,
+        workers=args.workers,
+        compress=args.compress
     )
     
 if __name__ == "__main__":
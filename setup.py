@@ -0,0 +1,14 @@
+"""Build script for the optional compiled hot loop.
+
+Usage:
+    python setup.py build_ext --inplace
+
+Requires Cython; the processor runs fine without the extension.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="flow-log-kernel",
+    ext_modules=cythonize("flow_log_kernel.pyx", language_level=3),
+)